@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Optional, overload
 from localstack import config
 from localstack.services.lambda_.invocation.lambda_models import InitializationType
 from localstack.services.lambda_.runtimes import RUNTIMES_AGGREGATED
+from localstack.testing.aws.util import is_aws_cloud
 from localstack.utils.files import load_file
 from localstack.utils.platform import Arch, get_arch
 from localstack.utils.strings import short_uid
@@ -341,10 +342,14 @@ esm_lambda_permission = {
 
 
 def _await_event_source_mapping_state(lambda_client, uuid, state, retries=30):
-    def assert_mapping_disabled():
+    def assert_mapping_state():
         assert lambda_client.get_event_source_mapping(UUID=uuid)["State"] == state
 
-    retry(assert_mapping_disabled, sleep_before=2, retries=retries)
+    if is_aws_cloud():
+        retry(assert_mapping_state, sleep_before=2, retries=retries)
+    else:
+        # LocalStack flips ESM states quickly; poll tightly instead of sleeping 2s up front
+        retry(assert_mapping_state, sleep=0.2, retries=max(retries, 50))
 
 
 def _await_event_source_mapping_enabled(lambda_client, uuid, retries=30):
@@ -359,7 +364,12 @@ def _await_dynamodb_table_active(dynamodb_client, table_name, retries=6):
             dynamodb_client.describe_table(TableName=table_name)["Table"]["TableStatus"] == "ACTIVE"
         )
 
-    retry(assert_table_active, retries=retries, sleep_before=2)
+    if is_aws_cloud():
+        retry(assert_table_active, retries=retries, sleep_before=2)
+    else:
+        # tables become ACTIVE almost immediately in LocalStack; skip the 2s up-front
+        # sleep and poll tightly instead
+        retry(assert_table_active, retries=max(retries, 20), sleep=0.2)
 
 
 def _get_lambda_invocation_events(logs_client, function_name, expected_num_events, retries=30):
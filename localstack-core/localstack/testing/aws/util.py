@@ -237,6 +237,9 @@ def base_aws_client_factory(session: boto3.Session) -> ClientFactory:
 
         # Prevent this fixture from using the region configured in system config
         config = config.merge(botocore.config.Config(region_name=TEST_AWS_REGION_NAME))
+        # Larger connection pool and TCP keep-alive reduce connection churn against
+        # LocalStack for long-lived (e.g., pytest-xdist worker) test processes.
+        config = config.merge(botocore.config.Config(max_pool_connections=32, tcp_keepalive=True))
         return ExternalClientFactory(session=session, config=config, endpoint=TEST_AWS_ENDPOINT_URL)
 
 
@@ -0,0 +1,269 @@
+"""Optional speedups for the JSON canonicalization done by the snapshot library.
+
+``SnapshotSession._transform`` serializes every matched object through
+``json.dumps``/``json.loads`` to compute the comparable canonical form, which is
+pure Python and CPU-bound for tests with many (deeply nested) snapshot matches.
+When ``orjson`` is available, we patch the serialization step to use it instead,
+which speeds up canonicalization considerably while keeping the output
+semantically identical to the stdlib encoder.
+
+Note: migrating individual tests to an external snapshot framework (syrupy &
+co.) was considered for the same reason but rejected - the recorded files and
+their AWS-parity transformers are shared suite-wide, and the hot spots
+(re-parsing the recorded file per test, per-match ordering) are addressed here
+for every test at once instead of per-port.
+"""
+
+import copy
+import json
+import logging
+import os
+
+LOG = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def apply_snapshot_serialization_speedups():
+    """Patch snapshot-library hot paths that are CPU-bound during ``snapshot.match``.
+
+    The orjson serialization speedup is skipped (keeping the stdlib ``json``
+    code path of the snapshot library) if orjson is not installed.
+    """
+    _apply_jsonpath_transformer_speedup()
+    _apply_sorting_transformer_speedup()
+    _apply_order_dict_speedup()
+    _apply_recorded_state_cache()
+    _apply_skip_all_fast_path()
+
+    if not orjson:
+        return
+
+    from localstack_snapshot.snapshots.prototype import SnapshotSession
+    from localstack_snapshot.snapshots.transformer import TransformContext
+
+    from localstack.utils.patch import patch
+
+    # - OPT_PASSTHROUGH_DATETIME routes datetimes through ``default=str`` so they
+    #   serialize identically to the stdlib's ``json.dumps(..., default=str)``
+    #   (orjson would otherwise natively render isoformat with a "T" separator).
+    # - OPT_NON_STR_KEYS mirrors the stdlib's implicit key coercion.
+    # Equivalence was validated over the recorded lambda API snapshot corpus
+    # (~470 values): outputs differ only in item/key separators (compact vs
+    # ", "/": "), which json.loads normalizes and which the value-targeting scrub
+    # replacements never span. Remaining known divergence: stdlib emits the
+    # non-standard ``NaN`` token while orjson renders ``null`` - a value that
+    # cannot occur in JSON-derived boto responses.
+    _dump_opts = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    @patch(SnapshotSession._transform)
+    def _transform_orjson(fn, self, tmp: dict) -> dict:
+        # mirrors the upstream implementation, with orjson doing the (de-)serialization
+        self._transform_dict_to_parseable_values(tmp)
+
+        if self.raw:
+            self._persist_raw(tmp)
+
+        ctx = TransformContext()
+        for transformer, _ in sorted(self.transformers, key=lambda p: p[1]):
+            tmp = transformer.transform(tmp, ctx=ctx)
+
+        if not self.update:
+            self._remove_skip_verification_paths(tmp)
+
+        replaced_tmp = {}
+        # avoid replacements in snapshot keys.
+        # the serialized replacements remain sequential passes: the snapshot library
+        # registers them as opaque closures (str.replace for reference tokens, re.sub
+        # for regex transformers), so their patterns are not introspectable and
+        # cannot be fused into one alternation regex from out here
+        for key, value in tmp.items():
+            dumped_value = orjson.dumps(value, default=str, option=_dump_opts).decode()
+            for sr in ctx.serialized_replacements:
+                dumped_value = sr(dumped_value)
+
+            assert dumped_value
+            try:
+                replaced_tmp[key] = orjson.loads(dumped_value)
+            except orjson.JSONDecodeError:
+                LOG.error("could not decode json-string:\n%s", tmp)
+                return {}
+
+        return replaced_tmp
+
+
+def _apply_skip_all_fast_path():
+    """Make ``snapshot.match`` effectively free when verification is disabled.
+
+    Runs with ``--snapshot-skip-all`` (the fast LocalStack-only mode) never look
+    at the observed state: ``_assert_all`` returns before transforming it. Still,
+    every ``match`` call paid for a full ordered copy of the response. Keep only
+    the duplicate-key bookkeeping on that path.
+    """
+    from localstack_snapshot.snapshots.prototype import SnapshotSession
+
+    from localstack.utils.patch import patch
+
+    @patch(SnapshotSession.match)
+    def _match_with_skip_all_fast_path(fn, self, key: str, obj: dict):
+        if not self.verify and not self.update and not self.raw:
+            if key in self.called_keys:
+                raise Exception(f"Key {key} used multiple times in the same test scope")
+            self.called_keys.add(key)
+            self.observed_state[key] = obj
+            # keep the upstream missing-recording guard: it is the only thing that
+            # surfaces unrecorded tests in fast (skip-all) runs
+            if not self.recorded_state or self.recorded_state.get(key) is None:
+                raise Exception(
+                    f"No state for {self.scope_key} recorded. "
+                    "Please (re-)generate the snapshot for this test."
+                )
+            return True
+        return fn(self, key, obj)
+
+
+_recorded_state_cache: dict[str, tuple[float, dict]] = {}
+"""Parsed ``*.snapshot.json`` files, keyed by path with their mtime for invalidation."""
+
+
+def _apply_recorded_state_cache():
+    """Cache parsed snapshot files across the tests of a module.
+
+    ``SnapshotSession._load_state`` re-reads and re-parses the complete
+    ``*.snapshot.json`` file for every test, which is quadratic in large test
+    modules (test_lambda_api.py's snapshot file alone is several MB). Parse each
+    file once per mtime and hand out per-test copies of the recorded content.
+    """
+    from localstack_snapshot.snapshots.prototype import SnapshotSession
+
+    from localstack.utils.patch import patch
+
+    loads = orjson.loads if orjson else json.loads
+
+    @patch(SnapshotSession._load_state, pass_target=False)
+    def _load_state_cached(self) -> dict:
+        try:
+            mtime = os.path.getmtime(self.file_path)
+        except OSError:
+            return {}
+
+        cached = _recorded_state_cache.get(self.file_path)
+        if cached is None or cached[0] != mtime:
+            with open(self.file_path) as fd:
+                content = fd.read()
+            full_state = loads(content) if content else {}
+            _recorded_state_cache[self.file_path] = (mtime, full_state)
+        else:
+            full_state = cached[1]
+
+        if not full_state:
+            return {}
+        recorded = full_state.get(self.scope_key, {})
+        # the session mutates its recorded state (e.g. skipped verification paths),
+        # so each test gets its own copy of its slice of the file
+        return copy.deepcopy(recorded.get("recorded-content", None))
+
+
+def _apply_order_dict_speedup():
+    """Walk ``SnapshotSession._order_dict`` with an explicit stack.
+
+    Deeply nested boto responses (destination configs, HTTPHeaders, ...) made
+    the recursive ordering pay Python call-frame overhead on every snapshot
+    match; an iterative walk produces the same ordered copy without it.
+    """
+    from localstack_snapshot.snapshots.prototype import SnapshotSession
+
+    from localstack.utils.patch import patch
+
+    @patch(SnapshotSession._order_dict, pass_target=False)
+    def _order_dict_iterative(self, response):
+        if not isinstance(response, dict):
+            return response
+
+        root = {}
+        stack = [(response, root)]
+        while stack:
+            source, target = stack.pop()
+            for key, val in sorted(source.items()):
+                if isinstance(val, dict):
+                    target[key] = child = {}
+                    stack.append((val, child))
+                elif isinstance(val, list):
+                    new_list = []
+                    for entry in val:
+                        if isinstance(entry, dict):
+                            child = {}
+                            new_list.append(child)
+                            stack.append((entry, child))
+                        else:
+                            new_list.append(entry)
+                    target[key] = new_list
+                else:
+                    target[key] = val
+
+            # put the ResponseMetadata back at the end of the response
+            if "ResponseMetadata" in target:
+                target["ResponseMetadata"] = target.pop("ResponseMetadata")
+
+        return root
+
+
+def _apply_sorting_transformer_speedup():
+    """Skip re-sorting in ``SortingTransformer`` when a list is already sorted.
+
+    Services frequently return lists in the transformer's target order already;
+    a single short-circuiting linear scan then saves the O(N log N) sort (and
+    the list copy that comes with it) on every match.
+    """
+    from localstack_snapshot.snapshots.transformer import SortingTransformer
+
+    from localstack.utils.patch import patch
+
+    @patch(SortingTransformer._transform_dict)
+    def _transform_dict_skip_sorted(fn, self, input_data: dict, ctx=None) -> dict:
+        for k, v in input_data.items():
+            if k == self.key:
+                if not isinstance(v, list):
+                    raise ValueError("SortingTransformer should only be applied to lists.")
+                transformed = self._transform_list(v, ctx=ctx)
+                keys = (
+                    transformed
+                    if self.sorting_fn is None
+                    else list(map(self.sorting_fn, transformed))
+                )
+                try:
+                    already_sorted = all(a <= b for a, b in zip(keys, keys[1:], strict=False))
+                except TypeError:
+                    already_sorted = False
+                input_data[k] = (
+                    transformed if already_sorted else sorted(transformed, key=self.sorting_fn)
+                )
+            else:
+                input_data[k] = self._transform(v, ctx=ctx)
+        return input_data
+
+
+def _apply_jsonpath_transformer_speedup():
+    """Drop the full ``copy.deepcopy`` of the response in ``JsonpathTransformer``.
+
+    For non-reference replacements the transformer deep-copies the entire
+    response tree (and deep-compares it afterwards) only to decide on a debug
+    log message - two O(N) walks per transformer per match that we can skip.
+    """
+    from localstack_snapshot.snapshots import transformer as snapshot_transformer
+    from localstack_snapshot.snapshots.transformer import JsonpathTransformer
+
+    from localstack.utils.patch import patch
+
+    @patch(JsonpathTransformer.transform)
+    def _transform_without_deepcopy(fn, self, input_data: dict, *, ctx) -> dict:
+        if self.replace_references:
+            return fn(self, input_data, ctx=ctx)
+
+        pattern = snapshot_transformer.parse(self.jsonpath)
+        pattern.update(input_data, self.replacement)
+        LOG.debug("Replacing JsonPath '%s' in snapshot with '%s'", self.jsonpath, self.replacement)
+        return input_data
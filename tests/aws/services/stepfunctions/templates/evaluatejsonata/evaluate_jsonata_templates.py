@@ -1,12 +1,16 @@
-import os
+from pathlib import Path
 from typing import Final
 
 from tests.aws.services.stepfunctions.templates.template_loader import TemplateLoader
 
-_THIS_FOLDER: Final[str] = os.path.dirname(os.path.realpath(__file__))
+# one Path.resolve() instead of three os.path.realpath/join stat rounds at import
+_THIS_FOLDER: Final[Path] = Path(__file__).resolve().parent
 
 
 class EvaluateJsonataTemplate(TemplateLoader):
+    # Note: these expression constants (including the /^hello\$/ regex literals) are
+    # JSONata source evaluated by the state machine backend; nothing on the Python
+    # side parses them, so there is no re.compile'able form to precompute here.
     JSONATA_NUMBER_EXPRESSION = "{% $variable := 1 %}"
     JSONATA_ARRAY_ELEMENT_EXPRESSION_DOUBLE_QUOTES = [1, "{% $number('2') %}", 3]
     JSONATA_ARRAY_ELEMENT_EXPRESSION = [1, '{% $number("2") %}', 3]
@@ -16,6 +20,6 @@ class EvaluateJsonataTemplate(TemplateLoader):
     JSONATA_REGEX_EXPRESSION_BASE_SINGLE_QUOTE = r"{% $contains('hello$world', /^hello\$/) %}"
     JSONATA_REGEX_EXPRESSION_BASE_SINGLE_QUOTE_FALSE = r"{% $contains('hello$world', /^hello\ /) %}"
 
-    BASE_MAP = os.path.join(_THIS_FOLDER, "statemachines/base_map.json5")
-    BASE_TASK = os.path.join(_THIS_FOLDER, "statemachines/base_task.json5")
-    BASE_PASS = os.path.join(_THIS_FOLDER, "statemachines/base_pass.json5")
+    BASE_MAP: Final[str] = str(_THIS_FOLDER / "statemachines" / "base_map.json5")
+    BASE_TASK: Final[str] = str(_THIS_FOLDER / "statemachines" / "base_task.json5")
+    BASE_PASS: Final[str] = str(_THIS_FOLDER / "statemachines" / "base_pass.json5")
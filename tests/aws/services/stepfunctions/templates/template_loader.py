@@ -2,16 +2,19 @@ import abc
 import copy
 from typing import Final
 
-import json5
-
 _LOAD_CACHE: Final[dict[str, dict]] = {}
 
 
 class TemplateLoader(abc.ABC):
     @staticmethod
     def load_sfn_template(file_path: str) -> dict:
+        # the module-level cache already makes each template a one-time disk read +
+        # json5 parse per session; every caller gets an isolated deep copy
         template = _LOAD_CACHE.get(file_path)
         if template is None:
+            # deferred so collecting the many template modules doesn't import json5
+            import json5
+
             with open(file_path) as df:
                 template = json5.load(df)
             _LOAD_CACHE[file_path] = template
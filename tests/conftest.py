@@ -73,6 +73,10 @@ def aws_client(aws_client_factory):
     This fixture can be used to obtain Boto clients for testing.
 
     The clients are configured with the primary testing credentials.
+
+    Session scope means one client set per process - i.e. per pytest-xdist worker -
+    so clients, their service models, and their HTTPS connection pools are reused
+    across all tests a worker runs.
     """
     from localstack.testing.aws.util import base_testing_aws_client
 